@@ -12,6 +12,7 @@ import argparse
 import contextlib
 import curses
 import curses.ascii
+import os
 import re
 import select
 import serial
@@ -21,6 +22,8 @@ import signalfd
 import sys
 
 INDICATOR_RE = re.compile(r'(?P<number>-?\d+\.\d+)\s+(?P<unit>\S+)')
+# Pre-bound so the fallback parse skips the attribute lookup
+_MATCH_INDICATOR = INDICATOR_RE.match
 
 def GetPort(list_only=False):
   """Find available serial ports"""
@@ -706,6 +709,41 @@ CHAR_SET4 = {
 CHAR_SETS = (CHAR_SET1, CHAR_SET2, CHAR_SET3, CHAR_SET4)
 
 
+def _scan_char_sets():
+  """Flatten every font into run spans, done once at module load.
+
+  Each glyph becomes (width, spans) where spans is a tuple of
+  (row_offset, col_offset, length, is_foreground) runs, so changing
+  font or style never has to re-scan the glyph strings.
+  """
+  scanned = []
+  for char_set in CHAR_SETS:
+    runs = {}
+    for ch, display in char_set.items():
+      # Rows are not all the same length (see 'i'), so size the glyph
+      # by its longest row and pad the short ones with background.
+      width = max(len(line) for line in display)
+      spans = []
+      for row_offset, line in enumerate(display):
+        for m in re.finditer(r'#+| +', line):
+          spans.append((row_offset, m.start(), len(m.group()),
+                        m.group()[0] == '#'))
+        if len(line) < width:
+          spans.append((row_offset, len(line), width - len(line), False))
+      runs[ch] = (width, tuple(spans))
+    scanned.append(runs)
+  return tuple(scanned)
+
+
+CHAR_SET_RUNS = _scan_char_sets()
+
+# Cache of pre-rendered glyphs, keyed by (char set index, base character).
+# Each entry maps a character to (width, spans) where spans is a tuple of
+# (row_offset, col_offset, text, is_foreground) runs ready to hand to
+# addstr, with the base character already substituted into foreground runs.
+_RENDERED = {}
+
+
 class IndicatorDisplay:
   """Class to manage curses display screen for indicator numbers"""
   
@@ -740,12 +778,15 @@ class IndicatorDisplay:
     self.pair_positive = self.COLOR_PAIR_GRN_ON_BLK
     self.pair_negative = self.COLOR_PAIR_RED_ON_BLK
     self.color_pair = self.pair_positive
+    self._rebuild_attrs()
     # Starting character set
-    self.char_set = CHAR_SETS[0]
+    self._char_set_idx = 0
     # Starting style
-    self.base_char = BASE_CHARACTERS[4]
+    self._base_char_idx = 4
     self.number = 0
     self.unit = 'mm'  # Or 'in'
+    self._dirty = False
+    self._rebuild_glyph_cache()
 
   def __enter__(self):
     return self
@@ -756,6 +797,23 @@ class IndicatorDisplay:
     if not exc_type:
       return True
 
+  def _rebuild_attrs(self):
+    # color_pair() only changes meaning when the pairs do (F2), so
+    # resolve it there rather than on every drawn span.
+    self._attr_positive = curses.color_pair(self.pair_positive)
+    self._attr_negative = curses.color_pair(self.pair_negative)
+    self._fg_attr = (self._attr_negative
+                     if self.color_pair == self.pair_negative
+                     else self._attr_positive)
+
+  @property
+  def char_set(self):
+    return CHAR_SETS[self._char_set_idx]
+
+  @property
+  def base_char(self):
+    return BASE_CHARACTERS[self._base_char_idx]
+
   def _foot_note(self):
     rows, cols = self.stdscr.getmaxyx()
     try:
@@ -765,44 +823,107 @@ class IndicatorDisplay:
     except curses.error:
       pass # Can have error on resize
   
+  def _rebuild_glyph_cache(self):
+    """Pre-render the current font/style into addstr-ready spans.
+
+    Done once per font or style change so _display_char has no string
+    work left to do on the redraw path.
+    """
+    # The screen content is stale for the new font/style
+    self._last_drawn = ('', None)
+    self._last_render_key = None
+    key = (self._char_set_idx, self.base_char)
+    rendered = _RENDERED.get(key)
+    if rendered is None:
+      base = self.base_char
+      rendered = {}
+      for ch, (width, runs) in CHAR_SET_RUNS[self._char_set_idx].items():
+        rendered[ch] = (width, tuple(
+          (row, col, base * length if is_fg else ' ' * length, is_fg)
+          for row, col, length, is_fg in runs))
+      _RENDERED[key] = rendered
+    self._glyphs = rendered
+
   def _display_char(self, ch):
     row, start_col = self.stdscr.getyx()
-    start_row = row
-    display = self.char_set.get(ch, self.char_set['?'])
-    for line in display:
+    width, spans = self._glyphs.get(ch, self._glyphs['?'])
+    for row_offset, col_offset, text, is_fg in spans:
       try:
-        self.stdscr.move(row, start_col)
-        for d in line:
-          if d != ' ':
-            self.stdscr.addch(self.base_char, curses.color_pair(self.color_pair))
-          else:
-            self.stdscr.addch(d)
-          self.stdscr.clrtoeol()
+        if is_fg:
+          self.stdscr.addstr(row + row_offset, start_col + col_offset, text,
+                             self._fg_attr)
+        else:
+          self.stdscr.addstr(row + row_offset, start_col + col_offset, text)
       except curses.error:
         pass  # Catch error on resize
-      row += 1
-
     # Move cursor to starting row and new column
-    _, end_col = self.stdscr.getyx()
-    self.stdscr.move(start_row, end_col)
-    return  
-    
-    self.stdscr.addch(ch)
+    try:
+      self.stdscr.move(row, start_col + width)
+    except curses.error:
+      pass  # Next column is off screen
+    return start_col + width
   
   def update_page(self):
+    # A stationary probe repeats the same reading; skip all curses
+    # work when nothing on screen would change.
+    key = (self.number, self.unit)
+    if key == self._last_render_key:
+      return
+    self._last_render_key = key
     # Convert number to string
     d = 2 if self.unit == 'mm' else 4
     n = self.number
     sign = '-' if n < 0 else ' '
     if sign == '-':
       self.color_pair = self.pair_negative
+      self._fg_attr = self._attr_negative
     else:
       self.color_pair = self.pair_positive
+      self._fg_attr = self._attr_positive
     num_str = f'{sign}{abs(n):0.{d}f} {self.unit}'
-    # Display the string character by character
-    self.stdscr.move(0, 0)
-    for ch in num_str:
-      self._display_char(ch)
+    # Only redraw the glyphs that changed since the last update. A
+    # color change invalidates everything, and a changed character can
+    # shift the columns of everything after it (glyph widths vary), so
+    # redraw from the first difference onward.
+    last_str, last_pair = self._last_drawn
+    if last_pair != self.color_pair:
+      last_str = ''
+    glyphs = self._glyphs
+    widths = [glyphs.get(ch, glyphs['?'])[0] for ch in num_str]
+    start = 0
+    for a, b in zip(num_str, last_str):
+      if a != b:
+        break
+      start += 1
+    # An unchanged trailing run (typically ' mm'/' in') can be skipped
+    # too, but only when the total width is unchanged so those glyphs
+    # still sit in the same columns.
+    stop = len(num_str)
+    if last_str and sum(widths) == sum(
+        glyphs.get(ch, glyphs['?'])[0] for ch in last_str):
+      max_suffix = min(len(num_str), len(last_str)) - start
+      suffix = 0
+      while (suffix < max_suffix
+             and num_str[-1 - suffix] == last_str[-1 - suffix]):
+        suffix += 1
+      stop -= suffix
+    # Display the changed characters one by one
+    col = sum(widths[:start])
+    for ch in num_str[start:stop]:
+      try:
+        self.stdscr.move(0, col)
+      except curses.error:
+        break  # The rest of the number is off the right edge
+      col = self._display_char(ch)
+    self._last_drawn = (num_str, self.color_pair)
+    # Clear the space to the right of the number (in case it got narrower)
+    end_col = sum(widths)
+    for r in range(len(self.char_set['0'])):
+      try:
+        self.stdscr.move(r, end_col)
+        self.stdscr.clrtoeol()
+      except curses.error:
+        pass  # Ignore going out of bounds on resize
     # Clear the space under the number displayed (in case resized)
     try:
       self.stdscr.move(len(self.char_set['0']), 0)
@@ -810,37 +931,46 @@ class IndicatorDisplay:
     except curses.error:
       pass  # Ignore going out of bounds on resize
     self._foot_note()
-    self.stdscr.refresh()
+    # Let curses diff the virtual screen against the physical one and
+    # only transmit the cells that changed.
+    self.stdscr.noutrefresh()
+    curses.doupdate()
 
   def display_number(self, number: str):
     """Parse number, store in object and refresh the page"""
-    m = INDICATOR_RE.match(number)
-    if not m:
-      self.number = '9.999'
-      self.unit = 'xx'
-    else:
-      self.number = float(m.group('number'))
-      self.unit = 'mm' if m.group('unit') == 'mm' else 'in'
+    # Well-formed input ('1.234 mm') is the overwhelmingly common case
+    # and needs no regex; fall back to it for anything else.
+    try:
+      num_s, unit = number.rsplit(None, 1)
+      self.number = float(num_s)
+      self.unit = 'mm' if unit == 'mm' else 'in'
+    except ValueError:
+      m = _MATCH_INDICATOR(number)
+      if not m:
+        self.number = '9.999'
+        self.unit = 'xx'
+      else:
+        self.number = float(m.group('number'))
+        self.unit = 'mm' if m.group('unit') == 'mm' else 'in'
     self.update_page()
   
   def handle_f1(self):
     """Change font"""
-    i = CHAR_SETS.index(self.char_set)
-    i = (i + 1) % len(CHAR_SETS)
-    self.char_set = CHAR_SETS[i]
+    self._char_set_idx = (self._char_set_idx + 1) % len(CHAR_SETS)
+    self._rebuild_glyph_cache()
     self.update_page()
 
   def handle_f2(self):
     """Change font style"""
-    i = BASE_CHARACTERS.index(self.base_char)
-    i = (i + 1) % len(BASE_CHARACTERS)
-    self.base_char = BASE_CHARACTERS[i]
+    self._base_char_idx = (self._base_char_idx + 1) % len(BASE_CHARACTERS)
     if self.base_char == ' ':
       self.pair_positive = self.COLOR_PAIR_GRN_ON_GRN
       self.pair_negative = self.COLOR_PAIR_RED_ON_RED
     else:
       self.pair_positive = self.COLOR_PAIR_GRN_ON_BLK
       self.pair_negative = self.COLOR_PAIR_RED_ON_BLK
+    self._rebuild_attrs()
+    self._rebuild_glyph_cache()
     self.update_page()
 
   def get_input(self):
@@ -855,7 +985,11 @@ class IndicatorDisplay:
       if ord(wch) in (curses.ascii.ESC, curses.ascii.EOT):
         return True  # Should end
     if wch == curses.KEY_RESIZE:
-      self.update_page()
+      # Just mark the screen stale; the select loop repaints once
+      # after draining events, coalescing a burst of resizes.
+      self._last_drawn = ('', None)  # Force a full redraw
+      self._last_render_key = None
+      self._dirty = True
     elif wch == curses.KEY_F1:
       self.handle_f1()
     elif wch == curses.KEY_F2:
@@ -871,35 +1005,56 @@ class IndicatorReader:
 
   def select_loop(self):
     try:
-      recv_prefix = 'Loop: '
       # Open serial port in non-blocking mode
-      with serial.Serial(self.port, self.baudrate, timeout=0) as monitor, \
-           IndicatorDisplay() as id:
+      with serial.Serial(self.port, self.baudrate, timeout=0) as monitor:
+        # Print before curses takes over the terminal
         print('Connected to: ', end='')
         print(monitor)
-        # Set up select loop here
+        with IndicatorDisplay() as id:
+          # Set up select loop here
 
-        indicator_fd = monitor.fileno()
-        stdin_fd = sys.stdin.fileno()
-        resize_fd = signalfd.signalfd(
-          -1, [signal.SIGWINCH], signalfd.SFD_CLOEXEC | signalfd.SFD_NONBLOCK)
+          indicator_fd = monitor.fileno()
+          stdin_fd = sys.stdin.fileno()
+          # A resize writes nothing to stdin and ncurses' SIGWINCH
+          # handler is C-level (Python just retries the interrupted
+          # select), so only a signalfd can wake the loop for one.
+          resize_fd = signalfd.signalfd(
+            -1, [signal.SIGWINCH], signalfd.SFD_CLOEXEC | signalfd.SFD_NONBLOCK)
 
-        inputs = [indicator_fd, stdin_fd, resize_fd]
+          inputs = [indicator_fd, stdin_fd, resize_fd]
 
-        line = ''
-        while True:
-          rlist, wlist, xlist = select.select(inputs, [], [])
-          if indicator_fd in rlist:
-            chars = monitor.read_until()
-            if chars:
+          line = ''
+          while True:
+            rlist, wlist, xlist = select.select(inputs, [], [])
+            if indicator_fd in rlist:
+              # select already said the fd is readable, so read it
+              # directly and skip pyserial's per-call bookkeeping;
+              # pyserial is still what configured and owns the port.
+              chars = os.read(indicator_fd, 4096)
+              if not chars:
+                # EOF: a dead fd stays readable forever, which would
+                # spin select with the display frozen
+                raise serial.SerialException(
+                  'Serial port returned no data (device disconnected?)')
               line += chars.decode('utf8')
-            if line.endswith('\n'):
-              #print(f"{recv_prefix}{line}", end='')
-              id.display_number(line)
-              line = ''
-          else:
-            if id.get_input():
-              break
+              if '\n' in line:
+                # Only the newest reading matters; drop any backlog that
+                # built up while rendering.
+                *complete, line = line.split('\n')
+                id.display_number(complete[-1])
+            else:
+              if resize_fd in rlist:
+                # Drain the signalfd so select can block again, then
+                # let get_wch deliver the pending KEY_RESIZE. ncurses'
+                # own SIGWINCH handler may win the race and leave
+                # nothing queued here.
+                with contextlib.suppress(BlockingIOError):
+                  os.read(resize_fd, 128)
+              if id.get_input():
+                break
+            if id._dirty:
+              id._dirty = False
+              id.update_page()
     except IOError as error:
       print('Problem opening monitor: ', error)
       sys.exit(-1)